@@ -1,9 +1,62 @@
-import pyCloudCompare as pcc
+import os
+
+# OpenMP-backed libraries (Open3D, NumPy's BLAS) size their thread pools when first loaded, and
+# letting each of them grab every core is often slower than a capped pool on the small problems
+# this CLI handles. Cap them to half the cores before any numeric import; values the user has
+# already set in the environment are respected.
+for _key in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(_key, str(max(1, (os.cpu_count() or 2) // 2)))
+
+import open3d as o3d
 from video_to_images_generator import extract_frames
 from user_manual import *
 from point_cloud_generator import PointCloudGenerator
 from utils import *
 import shlex
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+
+# Cache of PointCloudGenerator instances keyed by project path; the CLI loop is long-lived,
+# so repeated gpc invocations on the same project reuse one generator instead of rebuilding it
+_PCG_POOL = {}
+
+
+def _parse_optional_args(args, spec):
+    """
+    Parses optional positional command arguments against a declarative spec.
+
+    Parameters:
+    - args (list): The full argument list for the command.
+    - spec (tuple): One entry per optional argument: (index, name, type_, default, check),
+      where `check` is either None or a (predicate, error_message) pair applied to the
+      parsed value.
+
+    Returns:
+    - list or None: The parsed values in spec order, or None if a value failed to parse or
+      validate (an error is printed for the offending argument).
+
+    Commands list their optional arguments once in a table instead of repeating a
+    length-check/convert/except block per argument.
+    """
+    values = []
+    for index, name, type_, default, check in spec:
+        value = default
+        if index < len(args):
+            try:
+                value = type_(args[index])
+            except ValueError:
+                kind = "an integer" if type_ is int else "a float"
+                print_err(f"Invalid value for {name}. Please provide {kind}.")
+                return None
+            if check is not None:
+                predicate, message = check
+                if not predicate(value):
+                    print_err(message)
+                    return None
+        values.append(value)
+    return values
 
 
 def video_to_image(args):
@@ -38,34 +91,18 @@ def video_to_image(args):
         return 1
 
     video_path = args[1]
-    output_path = f"{args[2]}\\images"
-
-    # Default values
-    max_frames = 100
-    max_overlap_percentage = 6
-    ssim_threshold = 0.95
+    # Normalize the project path once instead of splicing separators into every downstream string
+    output_path = str(Path(args[2]) / "images")
 
     # Parse and validate optional arguments
-    if len(args) > 3:
-        try:
-            max_frames = int(args[3])
-        except ValueError:
-            print_err("Invalid value for maximum number of frames. Please provide an integer.")
-            return 1
-
-    if len(args) > 4:
-        try:
-            max_overlap_percentage = int(args[4])
-        except ValueError:
-            print_err("Invalid value for maximum overlap percentage. Please provide an integer.")
-            return 1
-
-    if len(args) > 5:
-        try:
-            ssim_threshold = float(args[5])
-        except ValueError:
-            print_err("Invalid value for SSIM threshold. Please provide a float.")
-            return 1
+    parsed = _parse_optional_args(args, (
+        (3, "maximum number of frames", int, 100, None),
+        (4, "maximum overlap percentage", int, 6, None),
+        (5, "SSIM threshold", float, 0.95, None),
+    ))
+    if parsed is None:
+        return 1
+    max_frames, max_overlap_percentage, ssim_threshold = parsed
 
     try:
         extracted_frames = extract_frames(video_path, output_path, max_frames,
@@ -102,21 +139,203 @@ def generate_point_cloud(args):
         return 1
 
     project_path = args[1]
-    pcg = PointCloudGenerator(project_path)
+
+    # Reuse the generator across repeated runs on the same project within this session, so the
+    # CloudCompare CLI wrapper and resolved binary paths are only set up once
+    pcg = _PCG_POOL.get(project_path)
+    if pcg is None:
+        pcg = PointCloudGenerator(project_path)
+        _PCG_POOL[project_path] = pcg
     pcg.run()
 
 
+def _ensure_binary_ply(path):
+    """
+    Returns a binary little-endian PLY version of the given cloud file.
+
+    Parameters:
+    - path (str): Path to a point cloud file.
+
+    Returns:
+    - str: The path to use for loading: either the original file or a cached binary copy.
+
+    ASCII PLY parses an order of magnitude slower than binary, so an ASCII input is converted
+    once into a '<name>.bin.ply' file next to it and that path is returned; the cached copy is
+    reused on later runs as long as it is newer than the source. Binary PLYs, non-PLY formats
+    and unreadable files are returned unchanged.
+    """
+    if not path.lower().endswith('.ply'):
+        return path
+    try:
+        with open(path, 'rb') as file:
+            if b'format ascii' not in file.read(128):
+                return path
+
+        cached = path[:-4] + '.bin.ply'
+        if not os.path.exists(cached) or os.path.getmtime(cached) < os.path.getmtime(path):
+            cloud = o3d.io.read_point_cloud(path)
+            if not cloud.has_points() or not o3d.io.write_point_cloud(cached, cloud, write_ascii=False):
+                return path
+        return cached
+    except OSError:
+        return path
+
+
+def _read_ply_header(file):
+    """
+    Reads the header of an open binary PLY file.
+
+    Parameters:
+    - file (file object): A PLY file opened in binary mode, positioned at the start.
+
+    Returns:
+    - tuple: The list of raw header lines (including 'end_header') and the vertex count.
+
+    Raises:
+    - ValueError: If the file has no 'end_header' line or no vertex element.
+    """
+    lines = []
+    while True:
+        line = file.readline()
+        if not line:
+            raise ValueError("Invalid PLY file: missing end_header.")
+        lines.append(line)
+        if line.strip() == b'end_header':
+            break
+
+    for line in lines:
+        if line.startswith(b'element vertex'):
+            return lines, int(line.split()[2])
+    raise ValueError("Invalid PLY file: missing vertex element.")
+
+
+def _concat_binary_ply(fix_path, mov_path, output_path):
+    """
+    Concatenates two binary PLY point clouds into a single file.
+
+    Parameters:
+    - fix_path (str): Path to the first binary PLY file.
+    - mov_path (str): Path to the second binary PLY file.
+    - output_path (str): Path for the combined PLY file.
+
+    Raises:
+    - ValueError: If either file is not a valid PLY or their vertex layouts differ.
+
+    The output reuses the first file's header with the summed vertex count and streams both
+    vertex bodies over with `shutil.copyfileobj`, so the merge is bounded by disk bandwidth
+    and never holds a concatenated copy of the clouds in memory. Both inputs must share the
+    same format and vertex property list, which holds for clouds written by Open3D.
+    """
+    with open(fix_path, 'rb') as fix, open(mov_path, 'rb') as mov, open(output_path, 'wb') as out:
+        fix_header, fix_count = _read_ply_header(fix)
+        mov_header, mov_count = _read_ply_header(mov)
+
+        # The raw bodies are only compatible when format and vertex layout match exactly
+        def layout(header):
+            return [line for line in header
+                    if not line.startswith(b'comment') and not line.startswith(b'element vertex')]
+
+        if layout(fix_header) != layout(mov_header):
+            raise ValueError("PLY files have different layouts and cannot be merged directly.")
+
+        for line in fix_header:
+            if line.startswith(b'element vertex'):
+                out.write(b'element vertex %d\n' % (fix_count + mov_count))
+            else:
+                out.write(line)
+
+        shutil.copyfileobj(fix, out, 1 << 20)
+        shutil.copyfileobj(mov, out, 1 << 20)
+
+
+def combine_pair(cloud1_path, cloud2_path, output_file, icp_iterations=50,
+                 max_corr_distance=1.0, voxel_size=0.02):
+    """
+    Aligns and merges a single pair of point clouds using ICP.
+
+    Parameters:
+    - cloud1_path (str): Path to the first (fixed) point cloud file.
+    - cloud2_path (str): Path to the second (moving) point cloud file.
+    - output_file (str): Path to save the merged point cloud ('.ply' is appended if missing).
+    - icp_iterations (int, optional): Maximum number of iterations for ICP (default: 50).
+    - max_corr_distance (float, optional): Maximum correspondence distance for ICP (default: 1.0).
+    - voxel_size (float, optional): Voxel size for the pre-ICP downsampling (default: 0.02). 0 disables.
+
+    Returns:
+    - tuple: The ICP fitness and inlier RMSE of the registration.
+
+    Raises:
+    - ValueError: If either cloud cannot be read or the merged cloud cannot be written.
+
+    This helper holds the registration core shared by `combine_point_clouds` and
+    `combine_point_clouds_batch`, so batch workers can run it in parallel processes.
+    """
+    if not output_file.lower().endswith('.ply'):
+        output_file += '.ply'
+
+    pc_fix = o3d.io.read_point_cloud(_ensure_binary_ply(cloud1_path))
+    pc_mov = o3d.io.read_point_cloud(_ensure_binary_ply(cloud2_path))
+
+    if not pc_fix.has_points() or not pc_mov.has_points():
+        raise ValueError("Failed to read one of the point clouds (no points found).")
+
+    # Estimate the transformation on downsampled copies; a coarser cloud converges just as
+    # well while cutting the per-iteration nearest-neighbour cost by the downsampling factor
+    if voxel_size > 0:
+        pc_fix_icp = pc_fix.voxel_down_sample(voxel_size)
+        pc_mov_icp = pc_mov.voxel_down_sample(voxel_size)
+    else:
+        pc_fix_icp = pc_fix
+        pc_mov_icp = pc_mov
+
+    # Point-to-plane ICP needs normals on the target (fixed) cloud; estimating them on the
+    # downsampled copy keeps the KD-tree neighbourhood queries cheap
+    pc_fix_icp.estimate_normals(
+        search_param=o3d.geometry.KDTreeSearchParamHybrid(radius=max(5 * voxel_size, 0.1), max_nn=30))
+
+    # Align the moving cloud onto the fixed cloud using ICP
+    result = o3d.pipelines.registration.registration_icp(
+        pc_mov_icp, pc_fix_icp, max_corr_distance,
+        estimation_method=o3d.pipelines.registration.TransformationEstimationPointToPlane(),
+        criteria=o3d.pipelines.registration.ICPConvergenceCriteria(max_iteration=icp_iterations))
+
+    # Apply the estimated transformation to the moving cloud
+    pc_mov.transform(result.transformation)
+
+    # Write each cloud once as binary PLY and splice the vertex bodies together on disk,
+    # instead of materializing a third, concatenated cloud (pc_fix + pc_mov) in memory
+    fix_tmp = output_file[:-4] + '_fix.tmp.ply'
+    mov_tmp = output_file[:-4] + '_mov.tmp.ply'
+    try:
+        if not (o3d.io.write_point_cloud(fix_tmp, pc_fix) and o3d.io.write_point_cloud(mov_tmp, pc_mov)):
+            raise ValueError(f"Failed to write merged point cloud to {output_file}.")
+        try:
+            _concat_binary_ply(fix_tmp, mov_tmp, output_file)
+        except ValueError:
+            # Layouts differ (e.g. only one cloud carries colors); fall back to an in-memory merge
+            if not o3d.io.write_point_cloud(output_file, pc_fix + pc_mov):
+                raise ValueError(f"Failed to write merged point cloud to {output_file}.")
+    finally:
+        for tmp in (fix_tmp, mov_tmp):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    return result.fitness, result.inlier_rmse
+
+
 def combine_point_clouds(args):
     """
     Combines two point clouds using ICP alignment and saves the merged result.
 
     Parameters:
     - args (list): Command-line arguments passed by the user. Expected arguments:
-        - args[1] (str): Path to the first point cloud file.
-        - args[2] (str): Path to the second point cloud file.
+        - args[1] (str): Path to the first (fixed) point cloud file.
+        - args[2] (str): Path to the second (moving) point cloud file.
         - args[3] (str): Path to save the merged point cloud.
-        - args[4] (int, optional): Number of iterations for ICP (default: 10,000).
-        - args[5] (int, optional): Overlap percentage for ICP (default: 40). Must be between 10 and 100.
+        - args[4] (int, optional): Maximum number of iterations for ICP (default: 50).
+        - args[5] (float, optional): Maximum correspondence distance for ICP (default: 1.0).
+        - args[6] (float, optional): Voxel size used to downsample both clouds before ICP (default: 0.02).
+          Set to 0 to register the full-resolution clouds.
 
     Returns:
     - int: Status code (2 for help message, 1 for error, None for success).
@@ -124,9 +343,17 @@ def combine_point_clouds(args):
     This function combines two point clouds by aligning them using Iterative Closest Point (ICP)
     and then merging them. The merged cloud is saved in the specified output file.
 
+    The registration runs in-process through Open3D, whose ICP parallelizes the KD-tree
+    correspondence search across cores, instead of launching a CloudCompare process per call.
+    The transformation is estimated on voxel-downsampled copies of both clouds (ICP cost scales
+    with point count through the KD-tree queries) and then applied to the full-resolution moving
+    cloud, so the merged output keeps every original point.
+    Registration uses the point-to-plane error metric with normals estimated on the fixed cloud,
+    which converges in tens of iterations where point-to-point needs thousands.
+
     Note:
     - To display help, use `-h` or `-help` as the second argument.
-    - Requires `pyCloudCompare` and `user_manual` modules.
+    - Requires `open3d` and `user_manual` modules.
     """
     if len(args) == 2 and (args[1] == "-h" or args[1] == "-help"):
         help_to_string("cpc_help")
@@ -140,50 +367,130 @@ def combine_point_clouds(args):
         print_err("Please provide path to output cloud file.")
         return 1
 
-    # Default values for ICP
-    icp_iterations = 10_000
-    icp_overlap = 40
-
     # Parse optional ICP parameters if provided
-    if len(args) > 4:
-        try:
-            icp_iterations = int(args[4])
-        except ValueError:
-            print_err("Invalid value for ICP iterations. Please provide an integer.")
-            return 1
+    parsed = _parse_optional_args(args, (
+        (4, "ICP iterations", int, 50, None),
+        (5, "maximum correspondence distance", float, 1.0,
+         (lambda v: v > 0, "Maximum correspondence distance must be positive.")),
+        (6, "voxel size", float, 0.02,
+         (lambda v: v >= 0, "Voxel size must be zero or positive.")),
+    ))
+    if parsed is None:
+        return 1
+    icp_iterations, max_corr_distance, voxel_size = parsed
 
-    if len(args) > 5:
-        try:
-            icp_overlap = int(args[5])
-            if not (10 <= icp_overlap <= 100):
-                print_err("ICP overlap percentage must be between 10 and 100.")
-                return 1
-        except ValueError:
-            print_err("Invalid value for ICP overlap. Please provide a float.")
-            return 1
+    try:
+        fitness, inlier_rmse = combine_pair(args[1], args[2], args[3], icp_iterations,
+                                            max_corr_distance, voxel_size)
+        print(f"Point clouds merged successfully (fitness: {fitness:.3f}, "
+              f"inlier RMSE: {inlier_rmse:.4f}).")
+
+    except Exception as e:
+        print_err(e)
 
-    # Remove '.ply' extension if present
-    output_file = args[3]
-    if output_file.lower().endswith('.ply'):
-        output_file = output_file[:-4]
 
+def combine_point_clouds_batch(args):
+    """
+    Combines several pairs of point clouds in parallel worker processes.
+
+    Parameters:
+    - args (list): Command-line arguments passed by the user. Expected arguments:
+        - args[1] (str): Path to a jobs file with one job per line: <cloud1_path> <cloud2_path> <output_path>.
+          Paths containing spaces must be quoted; blank lines and lines starting with '#' are skipped.
+        - args[2] (int, optional): Number of worker processes (default: half the CPU count).
+
+    Returns:
+    - int: Status code (2 for help message, 1 for error, None for success).
+
+    Each pair is registered and merged with the same ICP settings as `combinePointClouds`
+    (default iterations, correspondence distance and voxel size). The pairs run on a process
+    pool whose workers are capped to one thread each, so independent merges overlap on
+    separate cores instead of fighting over the same ones.
+
+    Note:
+    - To display help, use `-h` or `-help` as the second argument.
+    """
+    if len(args) == 2 and (args[1] == "-h" or args[1] == "-help"):
+        help_to_string("cpcb_help")
+        return 2
+
+    elif len(args) < 2:
+        print_err("Please provide the path to a jobs file.")
+        return 1
+
+    parsed = _parse_optional_args(args, (
+        (2, "number of workers", int, max(1, (os.cpu_count() or 2) // 2),
+         (lambda v: v >= 1, "Number of workers must be at least 1.")),
+    ))
+    if parsed is None:
+        return 1
+    workers = parsed[0]
+
+    # Parse the jobs file into (cloud1, cloud2, output) triples
+    jobs = []
     try:
-        cc_cmd = pcc.CloudCompareCLI().new_command()
-        #cc_cmd.silent()
-        cc_cmd.open(args[1])
-        cc_cmd.open(args[2])
-        cc_cmd.icp(iter_=icp_iterations, overlap=icp_overlap)
-        cc_cmd.merge_clouds()
-        cc_cmd.cloud_export_format(pcc.CLOUD_EXPORT_FORMAT.PLY)
-        cc_cmd.save_clouds(output_file)
-        print(cc_cmd.to_cmd())
-        if cc_cmd.execute() == 0:
-            print("Point clouds merged successfully.")
-        else:
-            print_err("Failed to merge point clouds.")
+        with open(args[1], 'r', encoding='utf-8') as file:
+            for line_num, line in enumerate(file, start=1):
+                line = line.strip()
+                if line == "" or line.startswith('#'):
+                    continue
+                parts = shlex.split(line)
+                if len(parts) != 3:
+                    print_err(f"Line {line_num} of the jobs file must contain exactly three paths.")
+                    return 1
+                jobs.append(parts)
+    except OSError as e:
+        print_err(f"Failed to read jobs file: {e}")
+        return 1
+
+    if not jobs:
+        print_err("The jobs file contains no jobs.")
+        return 1
+
+    # Each worker runs a full ICP of its own, so per-worker threading is capped to one thread.
+    # The caps have to sit in the parent's environment before the pool is constructed: worker
+    # processes copy it when they are spawned and size their OpenMP pools on their first
+    # Open3D import, so an initializer running inside the worker would be too late. The
+    # parent's own values are restored once the pool has shut down.
+    thread_keys = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS')
+    saved_env = {key: os.environ.get(key) for key in thread_keys}
+    for key in thread_keys:
+        os.environ[key] = '1'
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = {pool.submit(combine_pair, cloud1, cloud2, output): output
+                       for cloud1, cloud2, output in jobs}
+            for future in as_completed(futures):
+                output = futures[future]
+                try:
+                    fitness, inlier_rmse = future.result()
+                    print(f"Merged '{output}' (fitness: {fitness:.3f}, inlier RMSE: {inlier_rmse:.4f}).")
+                except Exception as e:
+                    print_err(f"Failed to merge '{output}': {e}")
 
     except Exception as e:
         print_err(e)
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+# Command dispatch table: maps each command name and alias to its handler, so resolving a
+# command is a single dict lookup instead of walking an elif chain of list-membership tests
+COMMANDS = {
+    'video2images': video_to_image,
+    'v2i': video_to_image,
+    'generatePointCloud': generate_point_cloud,
+    'gpc': generate_point_cloud,
+    'combinePointClouds': combine_point_clouds,
+    'cpc': combine_point_clouds,
+    'combinePointCloudsBatch': combine_point_clouds_batch,
+    'cpcb': combine_point_clouds_batch,
+}
 
 
 def cli(cmd):
@@ -200,30 +507,28 @@ def cli(cmd):
     - `video2images`, `v2i`: Extracts frames from a video.
     - `generatePointCloud`, `gpc`: Generates a point cloud from images.
     - `combinePointClouds`, `cpc`: Combines two point clouds.
+    - `combinePointCloudsBatch`, `cpcb`: Combines several pairs of point clouds in parallel.
     - `-h`, `-help`: Displays help information.
     - `-e`, `-stop`, `-quit`, `-exit`: Exits the CLI.
     """
 
     cmd = cmd.strip()
-    args = shlex.split(cmd)
+    # Tokenize once: shlex handles quoted paths but is a Python-level state machine, so plain
+    # commands take the C-level str.split fast path instead
+    args = shlex.split(cmd) if ('"' in cmd or "'" in cmd) else cmd.split()
 
-    if cmd == "":
+    if not args:
         pass
 
-    elif cmd in ['-h', '-help']:
+    elif len(args) == 1 and args[0] in ('-h', '-help'):
         help_to_string()
 
-    elif cmd in ['-e', '-stop', '-quit', '-exit']:
+    elif len(args) == 1 and args[0] in ('-e', '-stop', '-quit', '-exit'):
         return 0
 
-    elif args[0] in ['video2images', 'v2i']:
-        video_to_image(args)
-
-    elif args[0] in ['generatePointCloud', 'gpc']:
-        generate_point_cloud(args)
-
-    elif args[0] in ['combinePointClouds', 'cpc']:
-        combine_point_clouds(args)
-
     else:
-        print_err("Invalid command, type \033[35m-help\033[0m to read the user manual.")
+        handler = COMMANDS.get(args[0])
+        if handler is not None:
+            handler(args)
+        else:
+            print_err("Invalid command, type \033[35m-help\033[0m to read the user manual.")
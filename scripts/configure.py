@@ -1,17 +1,33 @@
+import ctypes
 import os
+import winreg
 from utils import print_err
 
+# Registry key holding the machine-wide environment variables (what SETX /M writes to)
+ENV_KEY_PATH = r'SYSTEM\CurrentControlSet\Control\Session Manager\Environment'
+
 
 def set_env_variable(variable_key, variable_value):
     """
-    Sets an environment variable to a specified value.
+    Sets a system environment variable to a specified value.
 
     Parameters:
     - variable_key (str): The name of the environment variable.
     - variable_value (str): The value to set the environment variable to.
+
+    The value is written straight to the machine environment key in the registry instead of
+    spawning a `SETX ... /M` child process (which also silently truncates values longer than
+    1024 characters), and WM_SETTINGCHANGE is broadcast so running shells pick up the change.
+    Like SETX /M, this requires administrative privileges.
     """
     try:
-        os.system("SETX {0} {1} /M".format(variable_key, variable_value))
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, ENV_KEY_PATH, 0, winreg.KEY_SET_VALUE) as key:
+            winreg.SetValueEx(key, variable_key, 0, winreg.REG_EXPAND_SZ, variable_value)
+
+        # Notify running processes that the machine environment changed
+        # (0xFFFF = HWND_BROADCAST, 0x001A = WM_SETTINGCHANGE)
+        ctypes.windll.user32.SendMessageTimeoutW(0xFFFF, 0x001A, 0, 'Environment', 0, 1000,
+                                                 ctypes.byref(ctypes.c_ulong()))
         print(f"Environment variable {variable_key} set to {variable_value}")
     except Exception as e:
         print_err(f"Error setting environment variable {variable_key} to {variable_value}: {e}")
@@ -1,4 +1,5 @@
 from CLI import print_err, check_admin_permission, intro_to_string, cli
+import ctypes
 import os
 
 
@@ -21,7 +22,7 @@ if __name__ == "__main__":
     - The script handles `KeyboardInterrupt` exceptions (e.g., when the user presses Ctrl+C) to allow for graceful exit.
 
     Special Notes:
-    - The script uses `os.system("")` to ensure that ANSI escape codes are enabled on Windows, allowing for colored output in the terminal.
+    - The script enables ANSI escape code processing on the Windows console via `SetConsoleMode`, allowing for colored output in the terminal.
 
     Usage:
     - Run this script directly in a Python environment to start the CLI.
@@ -29,7 +30,15 @@ if __name__ == "__main__":
     - To exit the CLI, use commands such as `-e`, `-stop`, `-quit`, `-exit`, or press Ctrl+C.
     """
 
-    os.system("")
+    # Enable ANSI escape processing on the Windows console by setting
+    # ENABLE_VIRTUAL_TERMINAL_PROCESSING directly, instead of the os.system("") trick that
+    # spawns a whole cmd.exe for the same side effect
+    if os.name == 'nt':
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
 
     """
     if not check_admin_permission():
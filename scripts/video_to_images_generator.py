@@ -1,8 +1,80 @@
 import cv2
-from skimage.metrics import structural_similarity as ssim
+import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from utils import *
 
+# Side length of the grayscale thumbnails the frame-similarity checks run on. SSIM compares
+# structure, not detail, so a 256x256 INTER_AREA reduction preserves the score's ranking while
+# shrinking the per-comparison working set from a full 1080p/4K frame to one that fits in cache.
+SSIM_THUMB_SIZE = (256, 256)
+
+
+def compute_ssim(gray1, gray2, window_size=7):
+    """
+    Computes the mean structural similarity (SSIM) between two grayscale images.
+
+    Parameters:
+    - gray1 (numpy.ndarray): First input image as a grayscale (uint8) numpy array.
+    - gray2 (numpy.ndarray): Second input image as a grayscale (uint8) numpy array.
+    - window_size (int, optional): Side length of the sliding comparison window (default is 7).
+
+    Returns:
+    - float: The mean SSIM over the image, in the range [-1, 1].
+
+    This computes the same uniform-window SSIM that `skimage.metrics.structural_similarity`
+    produces for uint8 inputs, but builds the windowed means and (co)variances with OpenCV box
+    filters, which run vectorized across the whole frame instead of through scipy's generic
+    correlate machinery. The frame comparison loop in `extract_frames` calls this once per
+    candidate frame, so it sits directly on the extraction hot path.
+    """
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+
+    img1 = gray1.astype(np.float32)
+    img2 = gray2.astype(np.float32)
+
+    kernel = (window_size, window_size)
+    mu1 = cv2.blur(img1, kernel)
+    mu2 = cv2.blur(img2, kernel)
+    mu11 = cv2.blur(img1 * img1, kernel)
+    mu22 = cv2.blur(img2 * img2, kernel)
+    mu12 = cv2.blur(img1 * img2, kernel)
+
+    # Unbiased (co)variance estimates, matching skimage's N/(N-1) normalization
+    cov_norm = window_size ** 2 / (window_size ** 2 - 1)
+    var1 = cov_norm * (mu11 - mu1 * mu1)
+    var2 = cov_norm * (mu22 - mu2 * mu2)
+    covar = cov_norm * (mu12 - mu1 * mu2)
+
+    ssim_map = ((2 * mu1 * mu2 + c1) * (2 * covar + c2)) / ((mu1 * mu1 + mu2 * mu2 + c1) * (var1 + var2 + c2))
+
+    # Ignore the border where the window hangs off the image, as skimage does
+    pad = (window_size - 1) // 2
+    return float(ssim_map[pad:-pad, pad:-pad].mean())
+
+
+def compute_dhash(gray):
+    """
+    Computes a 64-bit difference hash (dHash) of a grayscale image.
+
+    Parameters:
+    - gray (numpy.ndarray): Input image as a grayscale (uint8) numpy array.
+
+    Returns:
+    - int: The 64-bit hash as a Python integer.
+
+    The image is reduced to 9x8 pixels and each bit records whether a pixel is brighter than
+    its right-hand neighbour, which captures the frame's coarse gradient structure while being
+    insensitive to exposure changes. Comparing two hashes is a single XOR plus popcount, which
+    `extract_frames` uses as a cheap prefilter so the full SSIM computation only runs on frame
+    pairs whose similarity is genuinely ambiguous.
+    """
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int(np.packbits(bits).view(np.uint64)[0])
+
 
 def extract_frames(video_path, output_folder, max_frames=100, max_overlap_percentage=6, ssim_threshold=0.95):
     """
@@ -23,61 +95,106 @@ def extract_frames(video_path, output_folder, max_frames=100, max_overlap_percen
        extracted frames to ensure diversity in the extracted set.
 
        Note:
-       - Requires OpenCV (`cv2`), scikit-image (`skimage`), tqdm (`tqdm`), and `utils` module.
+       - Requires OpenCV (`cv2`), NumPy (`numpy`), tqdm (`tqdm`), and `utils` module.
        - Outputs frames named 'frame_0.jpg', 'frame_1.jpg', ..., 'frame_N.jpg' in the specified output folder.
        """
 
     # Create output folder if it doesn't exist
     mkdir(output_folder)
 
-    cap = cv2.VideoCapture(video_path)
+    # Opt into hardware-accelerated decoding (D3D11/VAAPI) where the backend supports it
+    cap = cv2.VideoCapture(video_path, cv2.CAP_ANY,
+                           [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
     # Calculate step size for extracting frames
-    step_size = total_frames // max_frames
+    step_size = max(1, total_frames // max_frames)
 
     count = 0
     frame_num = 0
+    grabbed = 0  # Number of frames grabbed so far; the next grab() returns frame index `grabbed`
     extracted_frames = []
+    extracted_grays = []  # Grayscale copy of each accepted frame, cached for the overlap check
 
-    prev_frame = None
+    prev_thumb = None  # Grayscale SSIM thumbnail of the last examined frame
+    prev_hash = None  # dHash of prev_thumb, the cheap prefilter for the SSIM check
 
+    # Accepted frames are encoded and written by background threads so the decode/similarity
+    # loop never stalls on disk I/O; shut down with wait=True below to flush pending writes
+    writer_pool = ThreadPoolExecutor(max_workers=4)
+
+    # mininterval/miniters let tqdm coalesce several accepted frames into one ANSI redraw,
+    # so a burst of accepts costs one console write instead of one per frame
     pbar = tqdm(total=max_frames, desc="Extracting frames", position=0, leave=True,
+                mininterval=0.25, miniters=5,
                 bar_format='\033[35m{desc}:\033[0m \033[1;37m{percentage:3.0f}%|{bar}|\033[0m \033[37m[{elapsed}<{remaining}]\033[0m')
 
     while count < max_frames and frame_num < total_frames:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-        ret, frame = cap.read()
+        # Step sequentially to the target frame with grab(), which parses packets without the
+        # full decode-to-BGR that read() pays; skipped frames never get converted. Sequential
+        # stepping also avoids the keyframe re-seek cost of setting CAP_PROP_POS_FRAMES.
+        ok = True
+        while grabbed <= frame_num:
+            ok = cap.grab()
+            if not ok:
+                break
+            grabbed += 1
+        if not ok:
+            break
+
+        ret, frame = cap.retrieve()
 
         if ret:
-            if prev_frame is not None:
-                # Calculate SSIM between current frame and previous frame
-                similarity = ssim(cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY), cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
-
-                if similarity > ssim_threshold:
-                    # Skip current frame if similarity is too high
+            # Convert once and compare SSIM on a small thumbnail; the previous frame's
+            # thumbnail is cached, so each iteration converts and resizes only the new frame
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            thumb = cv2.resize(gray, SSIM_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+            frame_hash = compute_dhash(thumb)
+
+            if prev_thumb is not None:
+                # Prefilter with the 64-bit dHash: a tiny Hamming distance means a near-exact
+                # duplicate and a large one a clearly different view, and either verdict is one
+                # XOR+popcount. Only the ambiguous middle band pays for the full SSIM.
+                hamming = (frame_hash ^ prev_hash).bit_count()
+                if hamming < 8:
+                    # Skip current frame, it is a near-duplicate of the previous one
                     frame_num += step_size
                     continue
-
-            # Check overlap with previous frames
+                if hamming <= 24:
+                    # Calculate SSIM between current frame and previous frame
+                    similarity = compute_ssim(prev_thumb, thumb)
+
+                    if similarity > ssim_threshold:
+                        # Skip current frame if similarity is too high
+                        frame_num += step_size
+                        continue
+
+            # Check overlap with the last 10 accepted frames, comparing against the grayscale
+            # copies cached on acceptance. The comparisons are batched into one reduction over
+            # a (K, H, W) stack — a single contiguous NumPy pass instead of up to ten separate
+            # OpenCV calls with Python-level dispatch between them.
             overlap = False
-            for existing_frame in extracted_frames[max(0, count - 10):]:  # Check last 10 frames for overlap
-                overlap_percentage = calculate_overlap_percentage(frame, existing_frame)
-                if overlap_percentage > max_overlap_percentage:
-                    overlap = True
-                    break
+            recent_grays = extracted_grays[max(0, count - 10):]
+            if recent_grays:
+                differing = np.count_nonzero(np.stack(recent_grays) != gray[None], axis=(1, 2))
+                total_pixels = gray.shape[0] * gray.shape[1]
+                overlap = bool(np.any((total_pixels - differing) / total_pixels * 100 > max_overlap_percentage))
 
             if not overlap:
                 extracted_frames.append(frame)
-                output_path = f"{output_folder}\\frame_{count}.jpg"
-                cv2.imwrite(output_path, frame)
+                extracted_grays.append(gray)
+                output_path = os.path.join(output_folder, f"frame_{count}.jpg")
+                # JPEG encode + disk write happen on the writer pool; OpenCV's encoder releases
+                # the GIL, so the next frame's decode and similarity checks proceed meanwhile.
+                # The frame needs no defensive copy — retrieve() returns a fresh array each call.
+                writer_pool.submit(cv2.imwrite, output_path, frame)
                 count += 1
                 pbar.update(1)
-                pbar.set_postfix({"Frame": count})
 
-            prev_frame = frame
+            prev_thumb = thumb
+            prev_hash = frame_hash
 
         frame_num += step_size
 
@@ -88,6 +205,7 @@ def extract_frames(video_path, output_folder, max_frames=100, max_overlap_percen
     pbar.close()
 
     cap.release()
+    writer_pool.shutdown(wait=True)  # Ensure every accepted frame has reached disk
 
     if len(extracted_frames) == 0:
         print_err("No frames were extracted.")
@@ -97,39 +215,3 @@ def extract_frames(video_path, output_folder, max_frames=100, max_overlap_percen
     return extracted_frames
 
 
-def calculate_overlap_percentage(image1, image2):
-    """
-    Calculates the percentage overlap between two images based on pixel differences.
-
-    Parameters:
-    - image1 (numpy.ndarray): First input image as a numpy array.
-    - image2 (numpy.ndarray): Second input image as a numpy array.
-
-    Returns:
-    - overlap_percentage (float): Percentage overlap between the two images.
-
-    This function computes the overlap percentage between two images by comparing
-    their grayscale versions. It calculates the absolute difference between the images,
-    counts the number of non-zero pixels (pixels that differ), and computes the
-    percentage overlap based on the total number of pixels.
-
-    Note:
-    - Requires OpenCV (`cv2`).
-    """
-    # Convert images to grayscale
-    gray_image1 = cv2.cvtColor(image1, cv2.COLOR_BGR2GRAY)
-    gray_image2 = cv2.cvtColor(image2, cv2.COLOR_BGR2GRAY)
-
-    # Compute absolute difference between the images
-    diff = cv2.absdiff(gray_image1, gray_image2)
-
-    # Count the number of non-zero pixels (pixels that are different)
-    non_zero_pixels = cv2.countNonZero(diff)
-
-    # Calculate overlap percentage
-    total_pixels = image1.shape[0] * image1.shape[1]
-    overlap_percentage = (total_pixels - non_zero_pixels) / total_pixels * 100
-
-    return overlap_percentage
-
-